@@ -1,14 +1,18 @@
 
 import os
 import sys
+import time
+import random
 import asyncio
 import argparse
-from datetime import datetime
-import json
+from itertools import islice
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-from scripts.config import Config
+sys.path.insert(0, _BASE_DIR)
+
+from scripts.config import get_config, get_shared_connector, close_shared_connector
+from scripts.constants import PRIORITY_PATH_PATTERN
 from scripts.ui import TerminalDisplay
 from scripts.scanner import Scanner
 from scripts.exporter import ResultExporter
@@ -16,19 +20,64 @@ from scripts.menu import start_menu
 from scripts.utils import setup_signal_handler, validate_url, count_lines_in_file
 from scripts.logger import get_logger
 from scripts.wordlist_updater import auto_update_wordlist
-from scripts.input_validator import validate_url as secure_validate_url, validate_paths_list
+from scripts.input_validator import validate_url as secure_validate_url
 from scripts.rate_limiter import get_rate_limiter
-from scripts.path_fuzzer import get_fuzzer, fuzz_paths
+from scripts.path_fuzzer import fuzz_paths
+from scripts.wordlist_loader import load_wordlist
 
 adv_logger = get_logger('logs')
 
+_RNG = random.Random()
+
+
+def _prepare_paths(config, wordlist_path):
+    paths, total_paths = load_wordlist(wordlist_path)
+    
+    if config.USE_PATH_FUZZING:
+        paths = fuzz_paths(paths, config.FUZZING_DEPTH)
+        adv_logger.log_info(f"Path fuzzing: expanded {total_paths} paths to {len(paths)} paths")
+        total_paths = len(paths)
+    
+    if config.DETECTION_MODE == "simple" and total_paths > 1000:
+        original_count = total_paths
+        paths = list(islice(paths, 1000))
+        total_paths = len(paths)
+        adv_logger.log_info(f"Simple mode: Limited paths from {original_count} to {len(paths)}")
+    elif config.DETECTION_MODE == "stealth" and total_paths > 500:
+        seen = set()
+        prioritized_paths, selected_random = [], []
+        random_count = 0
+        for p in paths:
+            if p in seen:
+                continue
+            seen.add(p)
+            if PRIORITY_PATH_PATTERN.search(p):
+                if len(prioritized_paths) < 300:
+                    prioritized_paths.append(p)
+                continue
+            random_count += 1
+            if len(selected_random) < 200:
+                selected_random.append(p)
+            else:
+                j = _RNG.randrange(random_count)
+                if j < 200:
+                    selected_random[j] = p
+        original_count = len(seen)
+        _RNG.shuffle(selected_random)
+        
+        paths = prioritized_paths + selected_random
+        total_paths = len(paths)
+        adv_logger.log_info(f"Stealth mode: Selected {len(paths)} optimized paths from {original_count}")
+    
+    return paths, total_paths
+
 
 async def scan_target(config, target_url, wordlist_path=None, export_format="", interactive=False):
     display = TerminalDisplay()
+    default_wordlist_path = os.path.join(_BASE_DIR, config.DEFAULT_WORDLIST)
     
     if not wordlist_path:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        wordlist_path = os.path.join(base_dir, config.DEFAULT_WORDLIST)
+        wordlist_path = default_wordlist_path
     
     is_valid, result = secure_validate_url(target_url)
     if not is_valid:
@@ -50,89 +99,43 @@ async def scan_target(config, target_url, wordlist_path=None, export_format="",
             print(f"Error: Wordlist file not found: {wordlist_path}")
             sys.exit(1)
     
-    scanner = await Scanner.create(config)
+    scanner_task = asyncio.create_task(Scanner.create(config))
+    
+    try:
+        paths, total_paths = await asyncio.to_thread(_prepare_paths, config, wordlist_path)
+    except Exception as e:
+        try:
+            await (await scanner_task).close()
+        except Exception as close_error:
+            adv_logger.log_warning(f"Error closing scanner: {str(close_error)}")
+        adv_logger.log_error(f"Error reading wordlist file: {str(e)}")
+        if interactive:
+            display.show_error(f"Error reading wordlist file: {str(e)}")
+            return [], {}
+        else:
+            print(f"Error: {str(e)}")
+            sys.exit(1)
+    
+    scanner = await scanner_task
     
     setup_signal_handler(scanner)
     
     try:
-        paths = []
-        if wordlist_path.endswith('.json'):
-            try:
-                with open(wordlist_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        paths = data
-                    elif isinstance(data, dict) and 'paths' in data:
-                        paths = data['paths']
-                    else:
-                        adv_logger.log_error(f"Invalid JSON format in wordlist: {wordlist_path}")
-                        paths = []
-            except Exception as e:
-                adv_logger.log_error(f"Error reading JSON wordlist: {str(e)}")
-                if interactive:
-                    display.show_error(f"Error reading JSON wordlist: {str(e)}")
-                    return [], {}
-                else:
-                    print(f"Error: {str(e)}")
-                    sys.exit(1)
-        else:
-            try:
-                with open(wordlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    paths = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            except Exception as e:
-                adv_logger.log_error(f"Error reading wordlist file: {str(e)}")
-                if interactive:
-                    display.show_error(f"Error reading wordlist file: {str(e)}")
-                    return [], {}
-                else:
-                    print(f"Error: {str(e)}")
-                    sys.exit(1)
-        
-        paths = [p for p in paths if p and isinstance(p, str)]
-        paths = validate_paths_list(paths)
-        
-        if config.USE_PATH_FUZZING:
-            fuzzer = get_fuzzer(config.FUZZING_DEPTH)
-            original_count = len(paths)
-            paths = fuzz_paths(paths, config.FUZZING_DEPTH)
-            adv_logger.log_info(f"Path fuzzing: expanded {original_count} paths to {len(paths)} paths")
-        
         mode_config = config.get_current_mode_config()
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        if config.DETECTION_MODE == "simple" and len(paths) > 1000:
-            original_count = len(paths)
-            paths = paths[:1000]
-            adv_logger.log_info(f"Simple mode: Limited paths from {original_count} to {len(paths)}")
-        elif config.DETECTION_MODE == "stealth" and len(paths) > 500:
-            original_count = len(paths)
-            admin_keywords = ['admin', 'administrator', 'dashboard', 'panel', 'control', 'login', 'cp']
-            prioritized_paths = [p for p in paths if any(keyword in p.lower() for keyword in admin_keywords)]
-            
-            random_paths = list(set(paths) - set(prioritized_paths))
-            import random
-            if random_paths:
-                random.shuffle(random_paths)
-                selected_random = random_paths[:200]
-            else:
-                selected_random = []
-                
-            paths = prioritized_paths[:300] + selected_random
-            adv_logger.log_info(f"Stealth mode: Selected {len(paths)} optimized paths from {original_count}")
         
-        scan_mode = "custom" if wordlist_path != os.path.join(base_dir, config.DEFAULT_WORDLIST) else "default"
-        adv_logger.log_scan_start(target_url, scan_mode, len(paths))
+        scan_mode = "custom" if wordlist_path != default_wordlist_path else "default"
+        adv_logger.log_scan_start(target_url, scan_mode, total_paths)
         
         if interactive:
             display.clear_screen()
             display.show_banner(config)
-            display.show_target_info(target_url, scan_mode, wordlist_path)
+            display.show_target_info(target_url, scan_mode, wordlist_path, paths_count=total_paths)
         else:
             print(f"\n{'='*60}")
             print(f"Find The Admin Panel v{config.VERSION}")
             print(f"{'='*60}")
             print(f"Target: {target_url}")
-            print(f"Wordlist: {wordlist_path} ({len(paths)} paths)")
+            print(f"Wordlist: {wordlist_path} ({total_paths} paths)")
             print(f"Mode: {config.DETECTION_MODE} - {mode_config.get('DESCRIPTION', '')}")
             if config.USE_PATH_FUZZING:
                 print(f"Path Fuzzing: Enabled (depth {config.FUZZING_DEPTH})")
@@ -142,49 +145,51 @@ async def scan_target(config, target_url, wordlist_path=None, export_format="",
                 print(f"Proxy: Enabled")
             print(f"{'='*60}\n")
         
-        start_time = datetime.now()
-        results = await scanner.scan(target_url, paths)
-        scan_time = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        results = await scanner.scan(target_url, paths, total=total_paths)
+        scan_time = time.perf_counter() - start_time
         
         scan_info = scanner.get_scan_info()
+        total_paths = scan_info.get("paths_count", total_paths)
         scan_info["scan_time"] = scan_time
         scan_info["target_url"] = target_url
         scan_info["scan_mode"] = scan_mode
         scan_info["detection_mode"] = config.DETECTION_MODE
-        scan_info["total_paths"] = len(paths)
+        scan_info["total_paths"] = total_paths
         scan_info["fuzzing_enabled"] = config.USE_PATH_FUZZING
         scan_info["rate_limiting_enabled"] = config.USE_RATE_LIMITING
         
+        found_results = [r for r in results if r.get("found", False)]
+        found_count = len(found_results)
+        
         adv_logger.log_scan_complete(
             target_url, 
-            len(paths), 
-            sum(1 for r in results if r.get("found", False)), 
+            total_paths, 
+            found_count, 
             scan_time
         )
         
         if interactive:
-            display.show_scan_completion(results, scan_time, len(paths))
+            display.show_scan_completion(results, scan_time, total_paths)
             display.show_results(results)
-            display.show_summary(len(paths), sum(1 for r in results if r.get("found", False)), scan_time)
+            display.show_summary(total_paths, found_count, scan_time)
         else:
-            found_count = sum(1 for r in results if r.get("found", False))
             print(f"\n{'='*60}")
             print(f"Scan completed in {scan_time:.2f} seconds")
-            print(f"Checked {len(paths)} paths")
+            print(f"Checked {total_paths} paths")
             print(f"Found {found_count} potential admin panels")
             print(f"{'='*60}\n")
             
             if found_count > 0:
                 print("Potential admin panels found:\n")
-                for r in results:
-                    if r.get("found", False):
-                        print(f"  ✓ {r.get('url')}")
-                        print(f"    Confidence: {r.get('confidence', 0):.2f} | Status: {r.get('status_code', 0)}")
-                        if r.get('title'):
-                            print(f"    Title: {r.get('title', 'N/A')}")
-                        if r.get('technologies'):
-                            print(f"    Tech: {', '.join(r.get('technologies', [])[:5])}")
-                        print()
+                for r in found_results:
+                    print(f"  ✓ {r.get('url')}")
+                    print(f"    Confidence: {r.get('confidence', 0):.2f} | Status: {r.get('status_code', 0)}")
+                    if r.get('title'):
+                        print(f"    Title: {r.get('title', 'N/A')}")
+                    if r.get('technologies'):
+                        print(f"    Tech: {', '.join(r.get('technologies', [])[:5])}")
+                    print()
         
         if config.SAVE_RESULTS:
             exporter = ResultExporter(config)
@@ -218,8 +223,7 @@ async def update_wordlists(config, source_url=None, interactive=False):
     display = TerminalDisplay()
     
     try:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        default_wordlist_path = os.path.join(base_dir, config.DEFAULT_WORDLIST)
+        default_wordlist_path = os.path.join(_BASE_DIR, config.DEFAULT_WORDLIST)
         
         if interactive:
             display.clear_screen()
@@ -228,7 +232,11 @@ async def update_wordlists(config, source_url=None, interactive=False):
         else:
             print(f"Updating wordlists...")
             
-        success, message, stats = auto_update_wordlist(default_wordlist_path, source_url)
+        success, message, stats = await auto_update_wordlist(
+            default_wordlist_path,
+            source_url,
+            connector=get_shared_connector(config.MAX_CONCURRENT_TASKS)
+        )
         
         if success:
             if interactive:
@@ -263,7 +271,7 @@ async def update_wordlists(config, source_url=None, interactive=False):
 
 async def main():
     try:
-        config = Config()
+        config = get_config()
         
         parser = argparse.ArgumentParser(
             description="Find The Admin Panel v7.0 - A powerful tool for identifying admin panels",
@@ -363,6 +371,8 @@ async def main():
     except Exception as e:
         print(f"Error: {str(e)}")
         adv_logger.log_error(f"Unhandled error: {str(e)}")
+    finally:
+        await close_shared_connector()
 
 
 if __name__ == "__main__":
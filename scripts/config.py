@@ -1,14 +1,82 @@
 import os
+import copy
 import json
 import logging
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Optional, Set
+from aiohttp import TCPConnector
+import socket
+from types import MappingProxyType
 
 from scripts.logger import get_logger
+from scripts.utils import json_loads
+from scripts.constants import DNS_CACHE_TTL, KEEPALIVE_TIMEOUT, DEFAULT_LIMIT_PER_HOST
 
 adv_logger = get_logger('logs')
 
-@dataclass
+_ENSURED_DIRS: Set[str] = set()
+_CONFIG_FILE_CACHE: Dict[str, Dict] = {}
+_shared_connector: Optional[TCPConnector] = None
+
+
+def _ensure_dir(directory: str):
+    if directory in _ENSURED_DIRS:
+        return
+    os.makedirs(directory, exist_ok=True)
+    _ENSURED_DIRS.add(directory)
+
+
+def _read_config_file(filepath: str) -> Dict:
+    if filepath not in _CONFIG_FILE_CACHE:
+        with open(filepath, 'rb') as f:
+            _CONFIG_FILE_CACHE[filepath] = json_loads(f.read())
+    return copy.deepcopy(_CONFIG_FILE_CACHE[filepath])
+
+
+_DEFAULT_MODE_CONFIGS = MappingProxyType({
+    "simple": {
+        "MAX_CONCURRENT_TASKS": 50,
+        "CONNECTION_TIMEOUT": 3,
+        "READ_TIMEOUT": 10,
+        "DELAY_BETWEEN_REQUESTS": 0.0,
+        "REQUEST_RANDOMIZATION": False,
+        "CONFIDENCE_THRESHOLD": 0.5,
+        "MAX_RETRIES": 1,
+        "USE_RANDOM_USER_AGENTS": False,
+        "VERIFY_FOUND_URLS": False,
+        "MAX_PATHS": 1000,
+        "DESCRIPTION": "Quick scan with minimal requests"
+    },
+    "aggressive": {
+        "MAX_CONCURRENT_TASKS": 100,
+        "CONNECTION_TIMEOUT": 5,
+        "READ_TIMEOUT": 15,
+        "DELAY_BETWEEN_REQUESTS": 0.0,
+        "REQUEST_RANDOMIZATION": False,
+        "CONFIDENCE_THRESHOLD": 0.6,
+        "MAX_RETRIES": 3,
+        "USE_RANDOM_USER_AGENTS": True,
+        "VERIFY_FOUND_URLS": True,
+        "MAX_PATHS": 10000,
+        "DESCRIPTION": "Thorough scan with maximum coverage"
+    },
+    "stealth": {
+        "MAX_CONCURRENT_TASKS": 10,
+        "CONNECTION_TIMEOUT": 8,
+        "READ_TIMEOUT": 20,
+        "DELAY_BETWEEN_REQUESTS": 1.5,
+        "REQUEST_RANDOMIZATION": True,
+        "CONFIDENCE_THRESHOLD": 0.7,
+        "MAX_RETRIES": 2,
+        "USE_RANDOM_USER_AGENTS": True,
+        "VERIFY_FOUND_URLS": True,
+        "MAX_PATHS": 500,
+        "DESCRIPTION": "Slow, careful scan to avoid detection"
+    }
+})
+
+
+@dataclass(slots=True)
 class Config:
     
     VERSION: str = "7.1"
@@ -68,6 +136,7 @@ class Config:
     DETECT_SOAP: bool = True
     
     EXPORT_FORMATS: List[str] = field(default_factory=lambda: ["txt", "json", "csv", "html"])
+    JSON_PRETTY: bool = False
     DETECTION_MODES: List[str] = field(default_factory=lambda: ["simple", "aggressive", "stealth"])
     DETECTION_MODE: str = "aggressive"
     SCAN_FREQUENCY: str = "once"
@@ -127,61 +196,16 @@ class Config:
         
         for directory in directories:
             if directory:
-                os.makedirs(directory, exist_ok=True)
+                _ensure_dir(directory)
                 
     def _setup_detection_modes(self):
-        default_modes = {
-            "simple": {
-                "MAX_CONCURRENT_TASKS": 50,
-                "CONNECTION_TIMEOUT": 3,
-                "READ_TIMEOUT": 10,
-                "DELAY_BETWEEN_REQUESTS": 0.0,
-                "REQUEST_RANDOMIZATION": False,
-                "CONFIDENCE_THRESHOLD": 0.5,
-                "MAX_RETRIES": 1,
-                "USE_RANDOM_USER_AGENTS": False,
-                "VERIFY_FOUND_URLS": False,
-                "MAX_PATHS": 1000,
-                "DESCRIPTION": "Quick scan with minimal requests"
-            },
-            "aggressive": {
-                "MAX_CONCURRENT_TASKS": 100,
-                "CONNECTION_TIMEOUT": 5,
-                "READ_TIMEOUT": 15,
-                "DELAY_BETWEEN_REQUESTS": 0.0,
-                "REQUEST_RANDOMIZATION": False,
-                "CONFIDENCE_THRESHOLD": 0.6,
-                "MAX_RETRIES": 3,
-                "USE_RANDOM_USER_AGENTS": True,
-                "VERIFY_FOUND_URLS": True,
-                "MAX_PATHS": 10000,
-                "DESCRIPTION": "Thorough scan with maximum coverage"
-            },
-            "stealth": {
-                "MAX_CONCURRENT_TASKS": 10,
-                "CONNECTION_TIMEOUT": 8,
-                "READ_TIMEOUT": 20,
-                "DELAY_BETWEEN_REQUESTS": 1.5,
-                "REQUEST_RANDOMIZATION": True,
-                "CONFIDENCE_THRESHOLD": 0.7,
-                "MAX_RETRIES": 2,
-                "USE_RANDOM_USER_AGENTS": True,
-                "VERIFY_FOUND_URLS": True,
-                "MAX_PATHS": 500,
-                "DESCRIPTION": "Slow, careful scan to avoid detection"
-            }
-        }
-        
-        if not self.MODE_CONFIGS:
-            self.MODE_CONFIGS = default_modes
-        else:
-            for mode, config in default_modes.items():
-                if mode not in self.MODE_CONFIGS:
-                    self.MODE_CONFIGS[mode] = config
-                else:
-                    for key, value in config.items():
-                        if key not in self.MODE_CONFIGS[mode]:
-                            self.MODE_CONFIGS[mode][key] = value
+        mode_configs = self.MODE_CONFIGS
+        for mode, defaults in _DEFAULT_MODE_CONFIGS.items():
+            current = mode_configs.get(mode)
+            if not current:
+                mode_configs[mode] = dict(defaults)
+            elif not defaults.keys() <= current.keys():
+                mode_configs[mode] = {**defaults, **current}
         
         if self.DETECTION_MODE in self.MODE_CONFIGS:
             mode_config = self.MODE_CONFIGS[self.DETECTION_MODE]
@@ -192,30 +216,28 @@ class Config:
             adv_logger.log_info(f"Applied {self.DETECTION_MODE} mode configuration with {self.MAX_CONCURRENT_TASKS} concurrent tasks")
     
     def save_config(self, filepath: str = "config/config.json"):
-        config_dict = {
-            key: value for key, value in self.__dict__.items() 
-            if not key.startswith('_') and not callable(value)
-        }
+        config_dict = {f.name: getattr(self, f.name) for f in fields(self)}
         
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        _ensure_dir(os.path.dirname(filepath))
             
         with open(filepath, 'w') as f:
             json.dump(config_dict, f, indent=4)
+        
+        _CONFIG_FILE_CACHE.pop(filepath, None)
             
     def load_config(self, filepath: str = "config/config.json"):
         try:
             if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    config_data = json.load(f)
+                config_data = _read_config_file(filepath)
                 
                 for key, value in config_data.items():
-                    if hasattr(self, key):
+                    if key in _FIELD_NAMES:
                         setattr(self, key, value)
                 
                 adv_logger.log_info(f"Configuration loaded from {filepath}")
             else:
                 adv_logger.log_warning(f"Configuration file {filepath} not found, using defaults")
-                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                _ensure_dir(os.path.dirname(filepath))
                 
         except json.JSONDecodeError as e:
             adv_logger.log_error(f"Error parsing configuration file {filepath}: {str(e)}")
@@ -259,3 +281,42 @@ class Config:
             "case_variations": self.FUZZING_CASE_VARIATIONS
         }
 
+
+_FIELD_NAMES = frozenset(f.name for f in fields(Config))
+
+_config: Optional[Config] = None
+
+
+def get_config() -> Config:
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
+
+
+def get_shared_connector(limit: int) -> TCPConnector:
+    global _shared_connector
+    if _shared_connector is None or _shared_connector.closed:
+        _shared_connector = TCPConnector(
+            ssl=False,
+            limit=limit,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            force_close=False,
+            enable_cleanup_closed=True,
+            family=socket.AF_INET,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            limit_per_host=DEFAULT_LIMIT_PER_HOST
+        )
+        adv_logger.log_info("Created shared TCP connector")
+    return _shared_connector
+
+
+async def close_shared_connector():
+    global _shared_connector
+    if _shared_connector is not None and not _shared_connector.closed:
+        try:
+            await _shared_connector.close()
+            adv_logger.log_info("Closed shared TCP connector")
+        except Exception as e:
+            adv_logger.log_error(f"Error closing shared TCP connector: {str(e)}")
+    _shared_connector = None
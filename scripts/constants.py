@@ -1,4 +1,5 @@
 import re
+from typing import Dict, Iterable
 
 HTTP_OK = 200
 HTTP_MOVED_PERMANENTLY = 301
@@ -27,6 +28,8 @@ DEFAULT_RATE_LIMIT = 50
 DEFAULT_BURST_SIZE = 10
 RATE_LIMIT_MIN = 1
 RATE_LIMIT_MAX = 1000
+HOST_LIMITER_CACHE_SIZE = 10000
+HOST_LIMITER_TTL = 600
 
 DEFAULT_CACHE_TTL = 3600
 DEFAULT_CACHE_SIZE = 1000
@@ -46,6 +49,32 @@ DEFAULT_CONFIDENCE_THRESHOLD = 0.6
 HIGH_CONFIDENCE_THRESHOLD = 0.8
 LOW_CONFIDENCE_THRESHOLD = 0.4
 
+
+def _keyword_trie_pattern(node: Dict) -> str:
+    if '' in node:
+        return ''
+    branches = [re.escape(ch) + _keyword_trie_pattern(child) for ch, child in sorted(node.items())]
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+
+def compile_keyword_pattern(keywords: Iterable[str], flags: int = re.IGNORECASE) -> re.Pattern:
+    minimal = []
+    for keyword in sorted({k.lower() for k in keywords if k}, key=len):
+        if not any(m in keyword for m in minimal):
+            minimal.append(keyword)
+    
+    trie = {}
+    for keyword in minimal:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    
+    return re.compile(_keyword_trie_pattern(trie), flags)
+
+
 ADMIN_KEYWORDS = [
     'admin', 'administrator', 'admincp', 'adm', 'moderator',
     'dashboard', 'control panel', 'cp', 'panel', 'login',
@@ -75,6 +104,8 @@ ERROR_KEYWORDS = [
     "找不到", "存在しません", "صفحة غير موجودة"
 ]
 
+PRIORITY_PATH_PATTERN = compile_keyword_pattern(PRIORITY_PATH_KEYWORDS)
+
 ERROR_PHRASES = [
     "page cannot be found", "page you requested could not be found",
     "page you are looking for does not exist", "404 error",
@@ -98,6 +129,7 @@ EXPORT_FORMATS = ['txt', 'json', 'csv', 'html']
 MAX_URL_LENGTH = 2048
 MAX_PATH_LENGTH = 2000
 MAX_FILENAME_LENGTH = 255
+MAX_JSON_SPEC_LENGTH = 10 * 1024 * 1024
 
 URL_PATTERN = re.compile(
     r'^https?://'
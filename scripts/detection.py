@@ -1,10 +1,72 @@
 
 import re
 import json
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass, field
 
-from scripts.constants import ADMIN_KEYWORDS
+from scripts.constants import ADMIN_KEYWORDS, MAX_JSON_SPEC_LENGTH
+from scripts.utils import json_loads
+
+_WS_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'ws://[^\s"\'<>]+',
+        r'wss://[^\s"\'<>]+',
+        r'new\s+WebSocket\s*\(["\']([^"\']+)["\']\)',
+        r'socket\.io',
+        r'sockjs',
+        r'Upgrade:\s*websocket',
+    )
+]
+
+_ADMIN_PATTERNS = [
+    (anchor, re.compile(pattern, re.IGNORECASE), boost) for anchor, pattern, boost in (
+        ('role', r'role\s*[=:]\s*["\']?admin', 0.15),
+        ('permission', r'permission\s*[=:]\s*["\']?admin', 0.15),
+        ('isadmin', r'isAdmin\s*[=:]\s*true', 0.2),
+        ('user_type', r'user_type\s*[=:]\s*["\']?admin', 0.15),
+        ('admin_access', r'admin_access', 0.1),
+    )
+]
+
+_SECURITY_PATTERNS = [
+    (pattern.lower(), name) for pattern, name in (
+        ('csrf', 'CSRF Protection'),
+        ('x-csrf-token', 'CSRF Token'),
+        ('__RequestVerificationToken', 'Anti-Forgery Token'),
+        ('captcha', 'CAPTCHA'),
+        ('recaptcha', 'reCAPTCHA'),
+        ('two-factor', 'Two-Factor Auth'),
+        ('otp', 'OTP Authentication'),
+    )
+]
+
+_BINARY_CONTENT_TYPES = (
+    'image/', 'audio/', 'video/', 'font/',
+    'application/octet-stream', 'application/zip', 'application/pdf'
+)
+
+
+def _scannable_content(content: str, headers: Dict[str, str]) -> str:
+    if not content or headers.get('Content-Type', '').lower().startswith(_BINARY_CONTENT_TYPES):
+        return ''
+    return content
+
+
+def _present_indicators(content: str, indicators: List[str]) -> Set[str]:
+    content_lower = content.lower()
+    return {ind.lower() for ind in indicators if ind.lower() in content_lower}
+
+
+def _headers_blob(headers: Dict[str, str]) -> str:
+    return ' '.join(f"{k}:{v}" for k, v in headers.items()).lower()
+
+
+def _looks_like_json(content: str) -> bool:
+    return len(content) < MAX_JSON_SPEC_LENGTH and content.lstrip().startswith('{')
+
+
+def _contains(content: str, found: Set[str], indicator: str) -> bool:
+    return indicator.lower() in found and indicator in content
 
 
 @dataclass
@@ -19,14 +81,7 @@ class EndpointInfo:
 class WebSocketDetector:
     
     def __init__(self):
-        self.ws_patterns = [
-            r'ws://[^\s"\'<>]+',
-            r'wss://[^\s"\'<>]+',
-            r'new\s+WebSocket\s*\(["\']([^"\']+)["\']\)',
-            r'socket\.io',
-            r'sockjs',
-            r'Upgrade:\s*websocket',
-        ]
+        self.ws_patterns = _WS_PATTERNS
         
         self.ws_paths = [
             '/ws', '/websocket', '/socket', '/socket.io',
@@ -46,8 +101,7 @@ class WebSocketDetector:
             ))
         
         for pattern in self.ws_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.findall(content):
                 if isinstance(match, tuple):
                     match = match[0] if match else ''
                 
@@ -56,7 +110,7 @@ class WebSocketDetector:
                         url=match,
                         endpoint_type='websocket',
                         confidence=0.85,
-                        details={'source': 'content', 'pattern': pattern}
+                        details={'source': 'content', 'pattern': pattern.pattern}
                     ))
         
         return endpoints
@@ -94,9 +148,12 @@ class GraphQLDetector:
         }
         '''
     
-    def detect(self, content: str, headers: Dict[str, str], url: str) -> List[EndpointInfo]:
+    def detect(self, content: str, headers: Dict[str, str], url: str, found: Optional[Set[str]] = None) -> List[EndpointInfo]:
         endpoints = []
         
+        if found is None:
+            found = _present_indicators(content, self.graphql_indicators)
+        
         content_type = headers.get('Content-Type', '')
         if 'application/graphql' in content_type:
             endpoints.append(EndpointInfo(
@@ -106,22 +163,22 @@ class GraphQLDetector:
                 details={'source': 'content_type'}
             ))
         
-        indicator_count = sum(1 for ind in self.graphql_indicators if ind in content)
-        if indicator_count >= 2:
-            confidence = min(0.9, 0.5 + indicator_count * 0.1)
+        hits = {ind for ind in self.graphql_indicators if _contains(content, found, ind)}
+        if '__schema' in hits or '__type' in hits:
             endpoints.append(EndpointInfo(
                 url=url,
                 endpoint_type='graphql',
-                confidence=confidence,
-                details={'source': 'content', 'indicator_count': indicator_count}
+                confidence=0.95,
+                details={'source': 'schema_detected'}
             ))
-        
-        if '__schema' in content or '__type' in content:
+        elif len(hits) >= 2:
+            indicator_count = len(hits)
+            confidence = min(0.9, 0.5 + indicator_count * 0.1)
             endpoints.append(EndpointInfo(
                 url=url,
                 endpoint_type='graphql',
-                confidence=0.95,
-                details={'source': 'schema_detected'}
+                confidence=confidence,
+                details={'source': 'content', 'indicator_count': indicator_count}
             ))
         
         return endpoints
@@ -153,13 +210,25 @@ class RESTAPIDetector:
             'x-api-key', 'Authorization'
         ]
     
-    def detect(self, content: str, headers: Dict[str, str], url: str) -> List[EndpointInfo]:
+    def detect(
+        self,
+        content: str,
+        headers: Dict[str, str],
+        url: str,
+        found: Optional[Set[str]] = None,
+        headers_blob: Optional[str] = None
+    ) -> List[EndpointInfo]:
         endpoints = []
         
+        if found is None:
+            found = _present_indicators(content, self.api_indicators)
+        if headers_blob is None:
+            headers_blob = _headers_blob(headers)
+        
         is_swagger = '"swagger"' in content or '"openapi"' in content
-        if is_swagger:
+        if is_swagger and _looks_like_json(content):
             try:
-                api_spec = json.loads(content)
+                api_spec = json_loads(content)
                 if 'swagger' in api_spec or 'openapi' in api_spec:
                     endpoints.append(EndpointInfo(
                         url=url,
@@ -174,7 +243,7 @@ class RESTAPIDetector:
             except json.JSONDecodeError:
                 pass
         
-        indicator_count = sum(1 for ind in self.api_indicators if ind.lower() in content.lower())
+        indicator_count = sum(1 for ind in self.api_indicators if ind.lower() in found)
         if indicator_count >= 2:
             confidence = min(0.85, 0.4 + indicator_count * 0.1)
             endpoints.append(EndpointInfo(
@@ -184,7 +253,7 @@ class RESTAPIDetector:
                 details={'source': 'content', 'indicator_count': indicator_count}
             ))
         
-        if 'x-api-key' in str(headers).lower() or 'x-ratelimit' in str(headers).lower():
+        if 'x-api-key' in headers_blob or 'x-ratelimit' in headers_blob:
             endpoints.append(EndpointInfo(
                 url=url,
                 endpoint_type='rest_api',
@@ -213,13 +282,22 @@ class SOAPDetector:
             'soap:Envelope', 'wsdl:definitions', 'targetNamespace',
             'soap:Body', 'portType', 'binding', 'service'
         ]
+        
+        self.wsdl_markers = ['wsdl:definitions', '<definitions']
+        self.envelope_markers = ['soap:Envelope', 'SOAP-ENV:Envelope']
     
-    def detect(self, content: str, headers: Dict[str, str], url: str) -> List[EndpointInfo]:
+    def get_indicators(self) -> List[str]:
+        return self.soap_indicators + self.wsdl_markers + self.envelope_markers
+    
+    def detect(self, content: str, headers: Dict[str, str], url: str, found: Optional[Set[str]] = None) -> List[EndpointInfo]:
         endpoints = []
         
+        if found is None:
+            found = _present_indicators(content, self.get_indicators())
+        
         content_type = headers.get('Content-Type', '')
         if 'text/xml' in content_type or 'application/soap+xml' in content_type:
-            if any(ind in content for ind in self.soap_indicators):
+            if any(_contains(content, found, ind) for ind in self.soap_indicators):
                 endpoints.append(EndpointInfo(
                     url=url,
                     endpoint_type='soap',
@@ -227,7 +305,7 @@ class SOAPDetector:
                     details={'source': 'content_type_and_content'}
                 ))
         
-        if 'wsdl:definitions' in content or '<definitions' in content:
+        if any(_contains(content, found, marker) for marker in self.wsdl_markers):
             endpoints.append(EndpointInfo(
                 url=url,
                 endpoint_type='soap',
@@ -235,7 +313,7 @@ class SOAPDetector:
                 details={'source': 'wsdl_detected', 'is_wsdl': True}
             ))
         
-        if 'soap:Envelope' in content or 'SOAP-ENV:Envelope' in content:
+        if any(_contains(content, found, marker) for marker in self.envelope_markers):
             endpoints.append(EndpointInfo(
                 url=url,
                 endpoint_type='soap',
@@ -256,27 +334,55 @@ class AdvancedDetector:
         self.graphql = GraphQLDetector()
         self.rest_api = RESTAPIDetector()
         self.soap = SOAPDetector()
+        
+        self._all_paths = tuple(dict.fromkeys(
+            self.websocket.get_common_paths()
+            + self.graphql.get_common_paths()
+            + self.rest_api.get_common_paths()
+            + self.soap.get_common_paths()
+        ))
+        
+        self._indicators = sorted({
+            ind.lower() for ind in (
+                self.graphql.graphql_indicators
+                + self.rest_api.api_indicators
+                + self.soap.get_indicators()
+                + [pattern for pattern, _ in _SECURITY_PATTERNS]
+                + [anchor for anchor, _, _ in _ADMIN_PATTERNS]
+            )
+        })
+    
+    def find_indicators(self, content: str) -> Set[str]:
+        content_lower = content.lower()
+        return {ind for ind in self._indicators if ind in content_lower}
     
     def detect_all(
         self,
         content: str,
         headers: Dict[str, str],
         url: str
+    ) -> Dict[str, List[EndpointInfo]]:
+        content = _scannable_content(content, headers)
+        found = self.find_indicators(content) if content else set()
+        return self._detect_all(content, headers, url, found, _headers_blob(headers))
+    
+    def _detect_all(
+        self,
+        content: str,
+        headers: Dict[str, str],
+        url: str,
+        found: Set[str],
+        headers_blob: str
     ) -> Dict[str, List[EndpointInfo]]:
         return {
             'websocket': self.websocket.detect(content, headers, url),
-            'graphql': self.graphql.detect(content, headers, url),
-            'rest_api': self.rest_api.detect(content, headers, url),
-            'soap': self.soap.detect(content, headers, url)
+            'graphql': self.graphql.detect(content, headers, url, found),
+            'rest_api': self.rest_api.detect(content, headers, url, found, headers_blob),
+            'soap': self.soap.detect(content, headers, url, found)
         }
     
-    def get_all_paths(self) -> List[str]:
-        paths = []
-        paths.extend(self.websocket.get_common_paths())
-        paths.extend(self.graphql.get_common_paths())
-        paths.extend(self.rest_api.get_common_paths())
-        paths.extend(self.soap.get_common_paths())
-        return list(set(paths))
+    def get_all_paths(self) -> Tuple[str, ...]:
+        return self._all_paths
     
     def analyze_admin_potential(
         self,
@@ -292,7 +398,10 @@ class AdvancedDetector:
             'security_features': []
         }
         
-        all_endpoints = self.detect_all(content, headers, url)
+        content = _scannable_content(content, headers)
+        found = self.find_indicators(content) if content else set()
+        headers_blob = _headers_blob(headers)
+        all_endpoints = self._detect_all(content, headers, url, found, headers_blob)
         
         for endpoint_type, endpoints in all_endpoints.items():
             if endpoints:
@@ -303,44 +412,23 @@ class AdvancedDetector:
                 if any('admin' in e.url.lower() for e in endpoints):
                     confidence_boost += 0.1
         
-        admin_patterns = [
-            (r'role\s*[=:]\s*["\']?admin', 0.15),
-            (r'permission\s*[=:]\s*["\']?admin', 0.15),
-            (r'isAdmin\s*[=:]\s*true', 0.2),
-            (r'user_type\s*[=:]\s*["\']?admin', 0.15),
-            (r'admin_access', 0.1),
-        ]
-        
-        for pattern, boost in admin_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for anchor, pattern, boost in _ADMIN_PATTERNS:
+            if anchor in found and pattern.search(content):
                 confidence_boost += boost
-                details['admin_indicators'].append(pattern)
-        
-        security_patterns = [
-            ('csrf', 'CSRF Protection'),
-            ('x-csrf-token', 'CSRF Token'),
-            ('__RequestVerificationToken', 'Anti-Forgery Token'),
-            ('captcha', 'CAPTCHA'),
-            ('recaptcha', 'reCAPTCHA'),
-            ('two-factor', 'Two-Factor Auth'),
-            ('otp', 'OTP Authentication'),
-        ]
+                details['admin_indicators'].append(pattern.pattern)
         
-        for pattern, name in security_patterns:
-            if pattern.lower() in content.lower() or pattern.lower() in str(headers).lower():
+        for pattern, name in _SECURITY_PATTERNS:
+            if pattern in found or pattern in headers_blob:
                 details['security_features'].append(name)
                 confidence_boost += 0.02
         
         return min(confidence_boost, 0.4), details
 
 
-_detector: Optional[AdvancedDetector] = None
+_detector = AdvancedDetector()
 
 
 def get_detector() -> AdvancedDetector:
-    global _detector
-    if _detector is None:
-        _detector = AdvancedDetector()
     return _detector
 
 
@@ -1,14 +1,35 @@
 
 import re
 import os
-from urllib.parse import urlparse, unquote
-from typing import Tuple, Optional, List
+from functools import lru_cache
+from urllib.parse import urlparse, unquote, ParseResult
+from typing import Tuple, Optional, List, Iterable, Iterator
 from scripts.constants import (
     URL_PATTERN, EMAIL_PATTERN, IP_ADDRESS_PATTERN,
     MAX_URL_LENGTH, MAX_PATH_LENGTH, MAX_FILENAME_LENGTH,
     FORBIDDEN_PATH_CHARS, PROXY_TYPES
 )
 
+_FILENAME_TRANSLATE = dict.fromkeys(map(ord, '/\\<>:"|?*'), '_')
+
+_IPV4_CHARS_DELETE = dict.fromkeys(map(ord, '0123456789.'))
+
+SUSPICIOUS_URL_PATTERN = re.compile(
+    r'javascript:|data:|vbscript:|<script|</script>|onerror=|onload=|onclick=',
+    re.IGNORECASE
+)
+
+PROXY_HOSTNAME_PATTERN = re.compile(r'^[a-zA-Z0-9.-]+$')
+
+VALID_PROXY_SCHEMES = ('http://', 'https://', 'socks4://', 'socks5://')
+
+_FORBIDDEN_RE = re.compile('|'.join(map(re.escape, FORBIDDEN_PATH_CHARS)))
+
+
+@lru_cache(maxsize=4096)
+def cached_urlparse(url: str) -> ParseResult:
+    return urlparse(url)
+
 
 class InputValidator:
     
@@ -18,6 +39,7 @@ class InputValidator:
         self.ip_pattern = IP_ADDRESS_PATTERN
         
         self.control_chars = set(chr(i) for i in range(32)) - {'\t', '\n', '\r'}
+        self._control_translate = dict.fromkeys(map(ord, self.control_chars))
     
     def validate_url(self, url: str) -> Tuple[bool, str]:
         if not url:
@@ -34,7 +56,7 @@ class InputValidator:
             url = 'https://' + url
         
         try:
-            parsed = urlparse(url)
+            parsed = cached_urlparse(url)
             
             if not parsed.netloc:
                 return False, "Invalid URL: missing domain"
@@ -60,17 +82,12 @@ class InputValidator:
         
         path = self._filter_control_chars(path)
         
-        for forbidden in FORBIDDEN_PATH_CHARS:
-            if forbidden in path:
-                return False, f"Path contains forbidden pattern: {repr(forbidden)}"
+        if _FORBIDDEN_RE.search(path):
+            forbidden = next(f for f in FORBIDDEN_PATH_CHARS if f in path)
+            return False, f"Path contains forbidden pattern: {repr(forbidden)}"
         
-        try:
-            decoded_path = unquote(path)
-            for forbidden in FORBIDDEN_PATH_CHARS:
-                if forbidden in decoded_path:
-                    return False, f"Path contains forbidden pattern after decoding"
-        except Exception:
-            pass
+        if '%' in path and _FORBIDDEN_RE.search(unquote(path)):
+            return False, f"Path contains forbidden pattern after decoding"
         
         path = path.replace('\\', '/')
         
@@ -78,13 +95,19 @@ class InputValidator:
         
         return True, path
     
-    def validate_paths_list(self, paths: List[str]) -> List[str]:
-        valid_paths = []
+    def iter_valid_paths(self, paths: Iterable[str]) -> Iterator[str]:
+        control_translate = self._control_translate
+        is_forbidden = _FORBIDDEN_RE.search
         for path in paths:
-            is_valid, result = self.validate_path(path)
-            if is_valid:
-                valid_paths.append(result)
-        return valid_paths
+            if not path or len(path) > MAX_PATH_LENGTH:
+                continue
+            path = path.translate(control_translate)
+            if is_forbidden(path) or ('%' in path and is_forbidden(unquote(path))):
+                continue
+            yield path.replace('\\', '/').lstrip('/')
+
+    def validate_paths_list(self, paths: List[str]) -> List[str]:
+        return list(self.iter_valid_paths(paths))
     
     def validate_email(self, email: str) -> Tuple[bool, str]:
         if not email:
@@ -95,7 +118,10 @@ class InputValidator:
         if len(email) > 254:
             return False, "Email address too long"
         
-        if self.email_pattern.match(email):
+        if '@' not in email or ' ' in email:
+            return False, "Invalid email format"
+        
+        if self.email_pattern.fullmatch(email):
             return True, email
         
         return False, "Invalid email format"
@@ -106,7 +132,10 @@ class InputValidator:
         
         ip = ip.strip()
         
-        if self.ip_pattern.match(ip):
+        if ip.translate(_IPV4_CHARS_DELETE):
+            return False, "Invalid IP address format"
+        
+        if self.ip_pattern.fullmatch(ip):
             return True, ip
         
         return False, "Invalid IP address format"
@@ -117,14 +146,11 @@ class InputValidator:
         
         proxy_url = proxy_url.strip()
         
-        valid_schemes = ['http://', 'https://', 'socks4://', 'socks5://']
-        has_valid_scheme = any(proxy_url.lower().startswith(scheme) for scheme in valid_schemes)
-        
-        if not has_valid_scheme:
-            return False, f"Proxy URL must start with one of: {', '.join(valid_schemes)}"
+        if not proxy_url[:9].lower().startswith(VALID_PROXY_SCHEMES):
+            return False, f"Proxy URL must start with one of: {', '.join(VALID_PROXY_SCHEMES)}"
         
         try:
-            parsed = urlparse(proxy_url)
+            parsed = cached_urlparse(proxy_url)
             
             if not parsed.netloc:
                 return False, "Invalid proxy URL: missing host"
@@ -136,7 +162,7 @@ class InputValidator:
                 return False, "Invalid proxy URL: missing host"
             
             if not self.ip_pattern.match(host):
-                if not re.match(r'^[a-zA-Z0-9.-]+$', host):
+                if not PROXY_HOSTNAME_PATTERN.match(host):
                     return False, "Invalid proxy hostname"
             
             return True, proxy_url
@@ -150,11 +176,7 @@ class InputValidator:
         
         filename = self._filter_control_chars(filename)
         
-        filename = filename.replace('/', '_').replace('\\', '_')
-        
-        invalid_chars = '<>:"|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        filename = filename.translate(_FILENAME_TRANSLATE)
         
         filename = filename.strip('. ')
         
@@ -181,22 +203,10 @@ class InputValidator:
             return False, 0
     
     def _filter_control_chars(self, text: str) -> str:
-        return ''.join(char for char in text if char not in self.control_chars)
+        return text.translate(self._control_translate)
     
     def _has_suspicious_patterns(self, url: str) -> bool:
-        suspicious_patterns = [
-            r'javascript:',
-            r'data:',
-            r'vbscript:',
-            r'<script',
-            r'</script>',
-            r'onerror=',
-            r'onload=',
-            r'onclick=',
-        ]
-        
-        url_lower = url.lower()
-        return any(re.search(pattern, url_lower) for pattern in suspicious_patterns)
+        return SUSPICIOUS_URL_PATTERN.search(url) is not None
 
 
 _validator = None
@@ -209,6 +219,7 @@ def get_validator() -> InputValidator:
     return _validator
 
 
+@lru_cache(maxsize=1024)
 def validate_url(url: str) -> Tuple[bool, str]:
     return get_validator().validate_url(url)
 
@@ -221,5 +232,9 @@ def validate_paths_list(paths: List[str]) -> List[str]:
     return get_validator().validate_paths_list(paths)
 
 
+def iter_valid_paths(paths: Iterable[str]) -> Iterator[str]:
+    return get_validator().iter_valid_paths(paths)
+
+
 def sanitize_filename(filename: str) -> str:
     return get_validator().sanitize_filename(filename)
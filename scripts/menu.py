@@ -3,13 +3,13 @@ import sys
 import re
 import time
 import asyncio
-import json
 from typing import List, Dict, Any, Optional, Union, Callable
 from scripts.logger import get_logger
 from scripts.ui import TerminalDisplay
 from scripts.config import Config
 from scripts.scanner import Scanner
 from scripts.exporter import ResultExporter
+from scripts.wordlist_loader import load_wordlist
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
@@ -212,30 +212,13 @@ class Menu:
                 display.show_progress(f"Starting {scan_mode} scan for {target_url}")
                 
                 try:
-                    paths = []
-                    if wordlist_path.endswith('.json'):
-                        try:
-                            with open(wordlist_path, 'r', encoding='utf-8') as f:
-                                paths_data = json.load(f)
-                                if isinstance(paths_data, dict) and 'paths' in paths_data:
-                                    paths = paths_data['paths']
-                                elif isinstance(paths_data, list):
-                                    paths = paths_data
-                                else:
-                                    display.show_error(f"Invalid JSON format in wordlist: {wordlist_path}")
-                                    paths = []
-                        except Exception as e:
-                            display.show_error(f"Error reading JSON file: {str(e)}")
-                            paths = []
-                    else:
-                        try:
-                            with open(wordlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                paths = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-                        except Exception as e:
-                            display.show_error(f"Error reading wordlist file: {str(e)}")
-                            paths = []
+                    try:
+                        paths, total_paths = load_wordlist(wordlist_path)
+                    except Exception as e:
+                        display.show_error(f"Error reading wordlist file: {str(e)}")
+                        paths, total_paths = [], 0
                     
-                    if not paths:
+                    if not total_paths:
                         display.show_error("No paths found for scanning in the specified file.")
                         display.get_input("Press Enter to continue...")
                         return
@@ -251,12 +234,11 @@ class Menu:
                     display.console.print(f"[bold cyan]Concurrency:[/bold cyan] {concurrency} tasks")
                     display.console.print(f"[bold cyan]Confidence Threshold:[/bold cyan] {mode_config.get('CONFIDENCE_THRESHOLD', 0.6)}")
                     
-                    total_paths = len(paths)
                     display.show_progress(f"Scanning {total_paths} paths for {target_url}")
                     
                     try:
                         if self.scanner:
-                            results = await self.scanner.scan(target_url, paths, self.config.MAX_CONCURRENT_TASKS)
+                            results = await self.scanner.scan(target_url, paths, self.config.MAX_CONCURRENT_TASKS, total=total_paths)
                         else:
                             display.show_error("Scanner not initialized")
                             display.get_input("\nPress Enter to return to main menu...")
@@ -284,6 +266,7 @@ class Menu:
                         self.last_scan_info = scan_info
                         
                         scan_time = scan_info.get("duration", 0)
+                        total_paths = scan_info.get("paths_count", total_paths)
                         found_count = sum(1 for r in results if r.get("found", False))
                         
                         display.show_scan_completion(results, scan_time, total_paths)
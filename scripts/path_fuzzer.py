@@ -1,10 +1,110 @@
 
-from typing import List, Set, Generator, Dict
+from functools import lru_cache
+from itertools import chain, islice
+from typing import List, Set, Generator, Dict, Iterable, Iterator, Tuple
 from scripts.constants import (
     FUZZING_EXTENSIONS, BACKUP_EXTENSIONS,
     PRIORITY_PATH_KEYWORDS, ADMIN_KEYWORDS
 )
 
+_PRIORITY_BASENAMES = frozenset(('admin', 'administrator', 'dashboard', 'login'))
+
+_EXTENSIONS_BY_DEPTH = {
+    1: ('.php', '.html', '.asp'),
+    2: ('.php', '.html', '.asp', '.aspx', '.jsp', '.htm'),
+    3: tuple(FUZZING_EXTENSIONS)
+}
+
+_BACKUP_EXTENSIONS_BY_DEPTH = {
+    1: ('.bak', '.old'),
+    2: ('.bak', '.old', '.backup', '.orig'),
+    3: tuple(BACKUP_EXTENSIONS)
+}
+
+_BASE_ADMIN_PATHS = (
+    'admin', 'administrator', 'admincp', 'admin_area', 'admin_panel',
+    'dashboard', 'control', 'controlpanel', 'cp', 'cpanel',
+    'backend', 'backoffice', 'manage', 'manager', 'management',
+    'login', 'signin', 'auth', 'authentication',
+    'panel', 'webadmin', 'sysadmin', 'adm', 'admin1', 'admin2',
+    'moderator', 'webmaster', 'site_admin', 'staff'
+)
+
+_CMS_ADMIN_PATHS = (
+    'wp-admin', 'wp-login.php', 'wp-admin/admin.php',
+    'administrator/index.php', 'joomla/administrator',
+    'user/login', 'admin/login', 'admin/dashboard',
+    'adminpanel', 'admins', 'admin_login', 'user/admin'
+)
+
+_API_PATHS = (
+    'api', 'api/v1', 'api/v2', 'api/admin', 'api/users',
+    'rest', 'rest/api', 'graphql', 'graphiql',
+    'swagger', 'swagger-ui', 'api-docs', 'docs/api',
+    'openapi', 'openapi.json', 'openapi.yaml',
+    'wsdl', 'soap', 'xmlrpc', 'jsonrpc',
+    '.well-known', 'health', 'status', 'ping',
+    'ws', 'websocket', 'socket.io'
+)
+
+
+@lru_cache(maxsize=8)
+def _build_admin_paths(depth: int, extensions: Tuple[str, ...]) -> Tuple[str, ...]:
+    paths: Dict[str, None] = dict.fromkeys(_BASE_ADMIN_PATHS)
+    paths.update(dict.fromkeys(_CMS_ADMIN_PATHS))
+    
+    if depth >= 2:
+        for path in _BASE_ADMIN_PATHS:
+            paths[f"{path}/login"] = None
+            paths[f"{path}/index"] = None
+            paths[f"{path}/dashboard"] = None
+            paths[f"{path}/home"] = None
+            
+            for ext in extensions:
+                paths[f"{path}{ext}"] = None
+                paths[f"{path}/login{ext}"] = None
+                paths[f"{path}/index{ext}"] = None
+    
+    return tuple(paths)
+
+
+@lru_cache(maxsize=8192)
+def _to_camel_case(s: str) -> str:
+    return ''.join(map(str.capitalize, s.replace('-', '_').split('_')))
+
+
+@lru_cache(maxsize=8192)
+def _to_title_case(s: str) -> str:
+    return '_'.join(map(str.capitalize, s.replace('-', '_').split('_')))
+
+
+def _unique(items: Iterable[str]) -> Iterator[str]:
+    seen: Set[str] = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+def _score_path(path: str) -> int:
+    path_lower = path.lower()
+    
+    score = 0
+    for keyword in PRIORITY_PATH_KEYWORDS:
+        if keyword in path_lower:
+            score += 10
+    
+    if path_lower.rpartition('/')[2].partition('.')[0] in _PRIORITY_BASENAMES:
+        score += 20
+    
+    if len(path) > 50:
+        score -= 5
+    
+    if path.endswith(('.php', '.aspx')):
+        score += 3
+    
+    return score
+
 
 class PathFuzzer:
     
@@ -24,28 +124,23 @@ class PathFuzzer:
         self.include_separator_variations = include_separator_variations
         self.max_variations_per_path = max_variations_per_path
         
-        if self.depth == 1:
-            self.extensions = ['.php', '.html', '.asp']
-        elif self.depth == 2:
-            self.extensions = ['.php', '.html', '.asp', '.aspx', '.jsp', '.htm']
-        else:
-            self.extensions = FUZZING_EXTENSIONS
-        
-        if self.depth == 1:
-            self.backup_extensions = ['.bak', '.old']
-        elif self.depth == 2:
-            self.backup_extensions = ['.bak', '.old', '.backup', '.orig']
-        else:
-            self.backup_extensions = BACKUP_EXTENSIONS
+        self.extensions = _EXTENSIONS_BY_DEPTH[self.depth]
+        self.backup_extensions = _BACKUP_EXTENSIONS_BY_DEPTH[self.depth]
     
     def fuzz_path(self, path: str) -> List[str]:
-        variations: Set[str] = set()
-        variations.add(path)
+        return list(self.fuzz_path_iter(path))
+    
+    def fuzz_path_iter(self, path: str) -> Iterator[str]:
+        return islice(_unique(self._iter_variations(path)), self.max_variations_per_path)
+    
+    def _iter_variations(self, path: str) -> Iterator[str]:
+        yield path
         
         path = path.strip('/')
         
-        parts = path.split('/')
-        basename = parts[-1] if parts else path
+        parent, _, basename = path.rpartition('/')
+        if parent:
+            parent += '/'
         
         if '.' in basename:
             name, ext = basename.rsplit('.', 1)
@@ -54,174 +149,84 @@ class PathFuzzer:
             name = basename
             original_ext = ''
         
-        if self.include_extensions:
+        if self.include_extensions and self.extensions:
+            stem = parent + name
             for ext in self.extensions:
-                new_basename = name + ext
-                if len(parts) > 1:
-                    new_path = '/'.join(parts[:-1]) + '/' + new_basename
-                else:
-                    new_path = new_basename
-                variations.add(new_path)
-                
-                if len(parts) > 1:
-                    variations.add('/'.join(parts[:-1]) + '/' + name)
-                else:
-                    variations.add(name)
+                yield stem + ext
+            yield stem
         
         if self.include_backups:
+            base_path = path[:-len(original_ext)] if original_ext else ''
             for backup_ext in self.backup_extensions:
-                variations.add(path + backup_ext)
+                yield path + backup_ext
                 
                 if original_ext:
-                    base_path = path[:-len(original_ext)]
-                    variations.add(base_path + backup_ext)
-                    
-                    variations.add(base_path + backup_ext + original_ext)
+                    yield base_path + backup_ext
+                    yield base_path + backup_ext + original_ext
         
         if self.include_case_variations:
-            variations.add(path.lower())
-            variations.add(path.upper())
+            yield path.lower()
+            yield path.upper()
             
-            variations.add(self._to_camel_case(path))
-            variations.add(self._to_title_case(path))
+            yield _to_camel_case(path)
+            yield _to_title_case(path)
         
         if self.include_separator_variations:
-            variations.add(path.replace('_', '-'))
-            variations.add(path.replace('-', '_'))
+            yield path.replace('_', '-')
+            yield path.replace('-', '_')
             
-            variations.add(path.replace('_', '').replace('-', ''))
-        
-        result = list(variations)[:self.max_variations_per_path]
-        
-        return result
+            yield path.replace('_', '').replace('-', '')
     
-    def fuzz_paths(self, paths: List[str]) -> List[str]:
-        all_variations: Set[str] = set()
-        
-        for path in paths:
-            variations = self.fuzz_path(path)
-            all_variations.update(variations)
-        
-        return list(all_variations)
+    def fuzz_paths(self, paths: Iterable[str]) -> List[str]:
+        return list(dict.fromkeys(chain.from_iterable(map(self.fuzz_path_iter, paths))))
     
     def generate_admin_paths(self) -> List[str]:
-        paths: Set[str] = set()
-        
-        base_paths = [
-            'admin', 'administrator', 'admincp', 'admin_area', 'admin_panel',
-            'dashboard', 'control', 'controlpanel', 'cp', 'cpanel',
-            'backend', 'backoffice', 'manage', 'manager', 'management',
-            'login', 'signin', 'auth', 'authentication',
-            'panel', 'webadmin', 'sysadmin', 'adm', 'admin1', 'admin2',
-            'moderator', 'webmaster', 'site_admin', 'staff'
-        ]
-        
-        cms_paths = [
-            'wp-admin', 'wp-login.php', 'wp-admin/admin.php',
-            'administrator/index.php', 'joomla/administrator',
-            'user/login', 'admin/login', 'admin/dashboard',
-            'adminpanel', 'admins', 'admin_login', 'user/admin'
-        ]
-        
-        paths.update(base_paths)
-        paths.update(cms_paths)
-        
-        if self.depth >= 2:
-            extended_paths: Set[str] = set()
-            
-            for path in base_paths:
-                extended_paths.add(f"{path}/login")
-                extended_paths.add(f"{path}/index")
-                extended_paths.add(f"{path}/dashboard")
-                extended_paths.add(f"{path}/home")
-                
-                for ext in self.extensions[:3]:
-                    extended_paths.add(f"{path}{ext}")
-                    extended_paths.add(f"{path}/login{ext}")
-                    extended_paths.add(f"{path}/index{ext}")
-            
-            paths.update(extended_paths)
-        
-        return list(paths)
+        return list(_build_admin_paths(self.depth, self.extensions[:3]))
     
     def generate_api_paths(self) -> List[str]:
-        paths = [
-            'api', 'api/v1', 'api/v2', 'api/admin', 'api/users',
-            'rest', 'rest/api', 'graphql', 'graphiql',
-            'swagger', 'swagger-ui', 'api-docs', 'docs/api',
-            'openapi', 'openapi.json', 'openapi.yaml',
-            'wsdl', 'soap', 'xmlrpc', 'jsonrpc',
-            '.well-known', 'health', 'status', 'ping',
-            'ws', 'websocket', 'socket.io'
-        ]
-        
-        return paths
+        return list(_API_PATHS)
     
     def prioritize_paths(self, paths: List[str]) -> List[str]:
-        def score_path(path: str) -> int:
-            score = 0
-            path_lower = path.lower()
-            
-            for keyword in PRIORITY_PATH_KEYWORDS:
-                if keyword in path_lower:
-                    score += 10
-            
-            basename = path.split('/')[-1].split('.')[0]
-            if basename.lower() in ['admin', 'administrator', 'dashboard', 'login']:
-                score += 20
-            
-            if len(path) > 50:
-                score -= 5
-            
-            if path.endswith('.php') or path.endswith('.aspx'):
-                score += 3
-            
-            return score
-        
-        return sorted(paths, key=score_path, reverse=True)
-    
-    def _to_camel_case(self, s: str) -> str:
-        parts = s.replace('-', '_').split('_')
-        return ''.join(word.capitalize() for word in parts)
-    
-    def _to_title_case(self, s: str) -> str:
-        parts = s.replace('-', '_').split('_')
-        return '_'.join(word.capitalize() for word in parts)
+        return sorted(paths, key=_score_path, reverse=True)
 
 
 class WordlistMutator:
     
+    SUBSTITUTIONS = {
+        'a': ['@', '4'],
+        'e': ['3'],
+        'i': ['1', '!'],
+        'o': ['0'],
+        's': ['$', '5'],
+        't': ['7']
+    }
+    SUFFIXES = ('1', '2', '3', '2024', '2025', '123', '1234')
+    PREFIXES = ('_', '-', '.', '')
+    
     def __init__(self, max_mutations: int = 10):
         self.max_mutations = max_mutations
+        self._substitution_tables = [
+            (char, {ord(char): replacement})
+            for char, replacements in self.SUBSTITUTIONS.items()
+            for replacement in replacements
+        ]
     
     def mutate(self, word: str) -> List[str]:
-        mutations: Set[str] = set()
-        mutations.add(word)
-        
-        substitutions = {
-            'a': ['@', '4'],
-            'e': ['3'],
-            'i': ['1', '!'],
-            'o': ['0'],
-            's': ['$', '5'],
-            't': ['7']
-        }
-        
-        for char, replacements in substitutions.items():
-            if char in word.lower():
-                for replacement in replacements:
-                    mutations.add(word.lower().replace(char, replacement))
-        
-        for i in range(1, 4):
-            mutations.add(word + str(i))
+        return list(islice(_unique(self._iter_mutations(word)), self.max_mutations))
+    
+    def _iter_mutations(self, word: str) -> Iterator[str]:
+        yield word
         
-        for year in ['2024', '2025', '123', '1234']:
-            mutations.add(word + year)
+        word_lower = word.lower()
+        for char, table in self._substitution_tables:
+            if char in word_lower:
+                yield word_lower.translate(table)
         
-        for prefix in ['_', '-', '.', '']:
-            mutations.add(prefix + word)
+        for suffix in self.SUFFIXES:
+            yield word + suffix
         
-        return list(mutations)[:self.max_mutations]
+        for prefix in self.PREFIXES:
+            yield prefix + word
     
     def mutate_wordlist(self, words: List[str]) -> List[str]:
         all_mutations: Set[str] = set()
@@ -243,7 +248,7 @@ def get_fuzzer(depth: int = 1) -> PathFuzzer:
     return _fuzzer
 
 
-def fuzz_paths(paths: List[str], depth: int = 1) -> List[str]:
+def fuzz_paths(paths: Iterable[str], depth: int = 1) -> List[str]:
     fuzzer = get_fuzzer(depth)
     return fuzzer.fuzz_paths(paths)
 
@@ -2,19 +2,23 @@
 import asyncio
 import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
-from urllib.parse import urlparse
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple, Deque, Set
 import aiohttp
 from aiohttp import ClientSession, TCPConnector
 
 from scripts.logger import get_logger
-from scripts.input_validator import get_validator
+from scripts.input_validator import get_validator, cached_urlparse
+from scripts.constants import DNS_CACHE_TTL
 
 adv_logger = get_logger('logs')
 
+_closing_sessions: Set[asyncio.Task] = set()
 
-@dataclass
+
+@dataclass(slots=True)
 class ProxyStats:
     total_requests: int = 0
     successful_requests: int = 0
@@ -25,6 +29,15 @@ class ProxyStats:
     last_failure: float = 0.0
     consecutive_failures: int = 0
     is_healthy: bool = True
+    performance_rank: Tuple[float, float] = (0.0, float('inf'))
+    
+    def update_performance_rank(self):
+        successful = self.successful_requests
+        if successful:
+            self.performance_rank = (
+                -successful / self.total_requests,
+                self.total_response_time / successful
+            )
     
     @property
     def success_rate(self) -> float:
@@ -39,7 +52,7 @@ class ProxyStats:
         return self.total_response_time / self.successful_requests
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Proxy:
     url: str
     type: str
@@ -49,14 +62,6 @@ class Proxy:
     password: Optional[str] = None
     stats: ProxyStats = field(default_factory=ProxyStats)
     
-    def __post_init__(self):
-        if not self.host or not self.port:
-            parsed = urlparse(self.url)
-            self.host = parsed.hostname or self.host
-            self.port = parsed.port or self.port
-            self.username = parsed.username or self.username
-            self.password = parsed.password or self.password
-    
     def get_aiohttp_proxy(self) -> str:
         if self.type in ('http', 'https'):
             return self.url
@@ -71,6 +76,9 @@ class Proxy:
         return False
 
 
+_performance_rank = attrgetter('stats.performance_rank')
+
+
 class ProxyManager:
     
     def __init__(
@@ -85,9 +93,10 @@ class ProxyManager:
         self.rotation_strategy = rotation_strategy
         
         self._proxies: List[Proxy] = []
-        self._current_index = 0
-        self._lock = asyncio.Lock()
+        self._proxies_by_url: Dict[str, Proxy] = {}
+        self._healthy: Deque[Proxy] = deque()
         self._health_check_task: Optional[asyncio.Task] = None
+        self._health_session: Optional[ClientSession] = None
         
         self.validator = get_validator()
         
@@ -104,8 +113,11 @@ class ProxyManager:
             adv_logger.log_warning(f"Invalid proxy URL: {result}")
             return False
         
+        if proxy_url in self._proxies_by_url:
+            return False
+        
         try:
-            parsed = urlparse(proxy_url)
+            parsed = cached_urlparse(proxy_url)
             proxy_type = parsed.scheme.lower()
             
             if proxy_type not in ('http', 'https', 'socks4', 'socks5'):
@@ -121,12 +133,11 @@ class ProxyManager:
                 password=parsed.password
             )
             
-            if proxy not in self._proxies:
-                self._proxies.append(proxy)
-                adv_logger.log_info(f"Added proxy: {proxy.host}:{proxy.port} ({proxy.type})")
-                return True
-            
-            return False
+            self._proxies_by_url[proxy_url] = proxy
+            self._proxies.append(proxy)
+            self._healthy.append(proxy)
+            adv_logger.log_info(f"Added proxy: {proxy.host}:{proxy.port} ({proxy.type})")
+            return True
             
         except Exception as e:
             adv_logger.log_error(f"Error adding proxy {proxy_url}: {str(e)}")
@@ -152,53 +163,56 @@ class ProxyManager:
         return count
     
     async def get_proxy(self) -> Optional[Proxy]:
-        async with self._lock:
-            healthy_proxies = [p for p in self._proxies if p.stats.is_healthy]
-            
-            if not healthy_proxies:
-                now = time.time()
-                for proxy in self._proxies:
-                    if now - proxy.stats.last_failure > self.health_check_interval:
-                        proxy.stats.is_healthy = True
-                        proxy.stats.consecutive_failures = 0
-                        healthy_proxies.append(proxy)
-            
-            if not healthy_proxies:
-                return None
-            
-            if self.rotation_strategy == 'random':
-                proxy = random.choice(healthy_proxies)
-            elif self.rotation_strategy == 'performance':
-                proxy = min(
-                    healthy_proxies,
-                    key=lambda p: (
-                        -p.stats.success_rate,
-                        p.stats.avg_response_time
-                    )
-                )
-            else:
-                self._current_index = (self._current_index + 1) % len(healthy_proxies)
-                proxy = healthy_proxies[self._current_index]
-            
-            proxy.stats.last_used = time.time()
-            return proxy
+        healthy = self._healthy
+        
+        if not healthy:
+            now = time.time()
+            for proxy in self._proxies:
+                if now - proxy.stats.last_failure > self.health_check_interval:
+                    proxy.stats.consecutive_failures = 0
+                    self._mark_healthy(proxy)
+        
+        if not healthy:
+            return None
+        
+        if self.rotation_strategy == 'random':
+            proxy = random.choice(healthy)
+        elif self.rotation_strategy == 'performance':
+            proxy = min(healthy, key=_performance_rank)
+        else:
+            healthy.rotate(-1)
+            proxy = healthy[0]
+        
+        proxy.stats.last_used = time.time()
+        return proxy
+    
+    def _mark_healthy(self, proxy: Proxy):
+        if not proxy.stats.is_healthy:
+            proxy.stats.is_healthy = True
+            self._healthy.append(proxy)
     
     def record_success(self, proxy: Proxy, response_time: float):
-        proxy.stats.total_requests += 1
-        proxy.stats.successful_requests += 1
-        proxy.stats.total_response_time += response_time
-        proxy.stats.last_success = time.time()
-        proxy.stats.consecutive_failures = 0
-        proxy.stats.is_healthy = True
+        stats = proxy.stats
+        stats.total_requests += 1
+        stats.successful_requests += 1
+        stats.total_response_time += response_time
+        stats.last_success = time.time()
+        stats.consecutive_failures = 0
+        stats.update_performance_rank()
+        self._mark_healthy(proxy)
     
     def record_failure(self, proxy: Proxy):
-        proxy.stats.total_requests += 1
-        proxy.stats.failed_requests += 1
-        proxy.stats.last_failure = time.time()
-        proxy.stats.consecutive_failures += 1
+        stats = proxy.stats
+        stats.total_requests += 1
+        stats.failed_requests += 1
+        stats.last_failure = time.time()
+        stats.consecutive_failures += 1
+        stats.update_performance_rank()
         
-        if proxy.stats.consecutive_failures >= self.max_failures:
-            proxy.stats.is_healthy = False
+        if stats.consecutive_failures >= self.max_failures:
+            if stats.is_healthy:
+                stats.is_healthy = False
+                self._healthy.remove(proxy)
             adv_logger.log_warning(
                 f"Proxy {proxy.host}:{proxy.port} marked unhealthy after "
                 f"{proxy.stats.consecutive_failures} consecutive failures"
@@ -210,28 +224,39 @@ class ProxyManager:
         try:
             start_time = time.time()
             
-            connector = TCPConnector(ssl=False, limit=1)
-            async with ClientSession(connector=connector) as session:
-                async with session.get(
-                    test_url,
-                    proxy=proxy.get_aiohttp_proxy(),
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                    allow_redirects=True
-                ) as response:
-                    response_time = time.time() - start_time
-                    
-                    if response.status < 400:
-                        self.record_success(proxy, response_time)
-                        return True
-                    else:
-                        self.record_failure(proxy)
-                        return False
+            session = self._get_health_session()
+            async with session.get(
+                test_url,
+                proxy=proxy.get_aiohttp_proxy(),
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                allow_redirects=True
+            ) as response:
+                response_time = time.time() - start_time
+                
+                if response.status < 400:
+                    self.record_success(proxy, response_time)
+                    return True
+                else:
+                    self.record_failure(proxy)
+                    return False
                         
         except Exception as e:
             self.record_failure(proxy)
             adv_logger.log_debug(f"Proxy health check failed for {proxy.host}:{proxy.port}: {str(e)}")
             return False
     
+    def _get_health_session(self) -> ClientSession:
+        if self._health_session is None or self._health_session.closed:
+            self._health_session = ClientSession(
+                connector=TCPConnector(ssl=False, limit=0, ttl_dns_cache=DNS_CACHE_TTL)
+            )
+        return self._health_session
+    
+    async def close_health_session(self):
+        if self._health_session is not None:
+            session, self._health_session = self._health_session, None
+            await session.close()
+    
     async def check_all_proxies(self):
         tasks = [self.check_proxy_health(proxy) for proxy in self._proxies]
         await asyncio.gather(*tasks, return_exceptions=True)
@@ -248,11 +273,20 @@ class ProxyManager:
         if self._health_check_task:
             self._health_check_task.cancel()
             self._health_check_task = None
+        
+        if self._health_session is not None:
+            try:
+                task = asyncio.get_running_loop().create_task(self.close_health_session())
+            except RuntimeError:
+                adv_logger.log_warning("Could not close proxy health session: no running event loop")
+            else:
+                _closing_sessions.add(task)
+                task.add_done_callback(_closing_sessions.discard)
     
     def get_stats(self) -> Dict:
         return {
             "total_proxies": len(self._proxies),
-            "healthy_proxies": sum(1 for p in self._proxies if p.stats.is_healthy),
+            "healthy_proxies": len(self._healthy),
             "proxies": [
                 {
                     "url": p.url,
@@ -273,7 +307,7 @@ class ProxyManager:
     
     @property
     def healthy_count(self) -> int:
-        return sum(1 for p in self._proxies if p.stats.is_healthy)
+        return len(self._healthy)
 
 
 _proxy_manager: Optional[ProxyManager] = None
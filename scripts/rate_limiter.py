@@ -1,16 +1,21 @@
 
 import time
 import asyncio
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Dict, Optional, Iterator, Tuple
 from dataclasses import dataclass, field
 from scripts.constants import (
     DEFAULT_RATE_LIMIT, DEFAULT_BURST_SIZE,
     RATE_LIMIT_MIN, RATE_LIMIT_MAX,
+    HOST_LIMITER_CACHE_SIZE, HOST_LIMITER_TTL,
     HTTP_TOO_MANY_REQUESTS
 )
 
+MIN_TIMER_DELAY = 1e-3
+CLOCK_EPSILON = 1e-9
 
-@dataclass
+
+@dataclass(slots=True)
 class RateLimitStats:
     total_requests: int = 0
     throttled_requests: int = 0
@@ -21,46 +26,157 @@ class RateLimitStats:
 
 class TokenBucket:
     
+    __slots__ = (
+        'rate', '_inv_rate', 'capacity', '_burst', '_next_allowed',
+        '_cond', '_waiting', '_refill_handle', '_notify_task'
+    )
+    
     def __init__(self, rate: float, capacity: int):
         self.rate = max(RATE_LIMIT_MIN, min(rate, RATE_LIMIT_MAX))
+        self._inv_rate = 1.0 / self.rate
         self.capacity = max(1, capacity)
-        self.tokens = float(capacity)
-        self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._burst = self.capacity * self._inv_rate + CLOCK_EPSILON
+        self._next_allowed = time.monotonic()
+        self._cond: Optional[asyncio.Condition] = None
+        self._waiting = 0
+        self._refill_handle: Optional[asyncio.Handle] = None
+        self._notify_task: Optional[asyncio.Task] = None
     
-    async def acquire(self, tokens: int = 1) -> bool:
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            
-            self.tokens = min(
-                self.capacity,
-                self.tokens + elapsed * self.rate
-            )
-            self.last_update = now
-            
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            
+    @property
+    def _condition(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+    
+    @property
+    def tokens(self) -> float:
+        backlog = self._next_allowed - time.monotonic()
+        if backlog <= 0.0:
+            return float(self.capacity)
+        return self.capacity - backlog * self.rate
+    
+    def try_acquire(self, tokens: int = 1) -> bool:
+        now = time.monotonic()
+        next_allowed = self._next_allowed
+        if next_allowed < now:
+            next_allowed = now
+        next_allowed += tokens * self._inv_rate
+        
+        if next_allowed - now > self._burst:
             return False
+        
+        self._next_allowed = next_allowed
+        return True
+    
+    async def acquire(self, tokens: int = 1) -> bool:
+        return self.try_acquire(tokens)
     
     async def wait_for_token(self, timeout: float = 30.0) -> bool:
-        start_time = time.monotonic()
+        if self.try_acquire():
+            return True
         
-        while True:
-            if await self.acquire():
-                return True
-            
-            elapsed = time.monotonic() - start_time
-            if elapsed >= timeout:
-                return False
-            
-            wait_time = min(1.0 / self.rate, timeout - elapsed)
-            await asyncio.sleep(wait_time)
+        try:
+            await asyncio.wait_for(self._wait_for_token(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _wait_for_token(self):
+        self._waiting += 1
+        try:
+            cond = self._condition
+            async with cond:
+                while not self.try_acquire():
+                    self._schedule_refill()
+                    await cond.wait()
+        finally:
+            self._waiting -= 1
+    
+    def _schedule_refill(self, needed: float = 1.0):
+        if self._refill_handle is None:
+            loop = asyncio.get_running_loop()
+            delay = (needed - self.tokens) * self._inv_rate
+            if delay < MIN_TIMER_DELAY:
+                self._refill_handle = loop.call_soon(self._on_refill)
+            else:
+                self._refill_handle = loop.call_later(delay, self._on_refill)
+    
+    def _on_refill(self):
+        self._refill_handle = None
+        if self._notify_task is None or self._notify_task.done():
+            self._notify_task = asyncio.get_running_loop().create_task(self._notify_waiters())
+    
+    async def _notify_waiters(self):
+        cond = self._condition
+        async with cond:
+            available = max(1, int(self.tokens))
+            cond.notify(available)
+            if self._waiting > available:
+                self._schedule_refill(available + 1)
     
     def update_rate(self, new_rate: float):
+        now = time.monotonic()
+        backlog_tokens = max(0.0, self._next_allowed - now) * self.rate
+        
         self.rate = max(RATE_LIMIT_MIN, min(new_rate, RATE_LIMIT_MAX))
+        self._inv_rate = 1.0 / self.rate
+        self._burst = self.capacity * self._inv_rate + CLOCK_EPSILON
+        self._next_allowed = now + backlog_tokens * self._inv_rate
+        
+        if self._refill_handle is not None:
+            self._refill_handle.cancel()
+            self._refill_handle = None
+            self._schedule_refill()
+
+
+@dataclass(slots=True)
+class HostLimiter:
+    bucket: TokenBucket
+    stats: RateLimitStats
+    last_access: float = 0.0
+    referenced: bool = False
+
+
+class HostLimiterCache:
+    
+    def __init__(self, maxsize: int = HOST_LIMITER_CACHE_SIZE, ttl: float = HOST_LIMITER_TTL):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._entries: OrderedDict[str, HostLimiter] = OrderedDict()
+    
+    def get(self, host: str) -> Optional[HostLimiter]:
+        entry = self._entries.get(host)
+        if entry is not None:
+            entry.referenced = True
+        return entry
+    
+    def add(self, host: str, bucket: TokenBucket, stats: RateLimitStats) -> HostLimiter:
+        now = time.monotonic()
+        entries = self._entries
+        
+        while entries:
+            oldest_host, oldest = next(iter(entries.items()))
+            if oldest.referenced:
+                oldest.referenced = False
+                oldest.last_access = now
+                entries.move_to_end(oldest_host)
+            elif len(entries) >= self.maxsize or now - oldest.last_access > self.ttl:
+                del entries[oldest_host]
+            else:
+                break
+        
+        entry = HostLimiter(bucket, stats, now)
+        entries[host] = entry
+        return entry
+    
+    def items(self) -> Iterator[Tuple[str, HostLimiter]]:
+        return iter(self._entries.items())
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class AdaptiveRateLimiter:
@@ -83,35 +199,33 @@ class AdaptiveRateLimiter:
         self.bucket = TokenBucket(initial_rate, burst_size)
         self.stats = RateLimitStats(current_rate=initial_rate)
         
-        self.host_buckets: Dict[str, TokenBucket] = {}
-        self.host_stats: Dict[str, RateLimitStats] = {}
-        
-        self._lock = asyncio.Lock()
+        self.host_limiters = HostLimiterCache()
         
         self._consecutive_successes = 0
         self._success_threshold = 50
     
     async def acquire(self, host: Optional[str] = None) -> bool:
-        self.stats.total_requests += 1
+        stats = self.stats
+        stats.total_requests += 1
         
-        if not await self.bucket.acquire():
-            self.stats.throttled_requests += 1
+        if not self.bucket.try_acquire():
+            stats.throttled_requests += 1
             return False
         
         if host:
-            async with self._lock:
-                if host not in self.host_buckets:
-                    self.host_buckets[host] = TokenBucket(
-                        self.current_rate / 2,
-                        max(1, DEFAULT_BURST_SIZE // 2)
-                    )
-                    self.host_stats[host] = RateLimitStats()
+            limiter = self.host_limiters.get(host)
+            if limiter is None:
+                limiter = self.host_limiters.add(
+                    host,
+                    TokenBucket(self.current_rate / 2, max(1, DEFAULT_BURST_SIZE // 2)),
+                    RateLimitStats()
+                )
             
-            if not await self.host_buckets[host].acquire():
-                self.stats.throttled_requests += 1
+            if not limiter.bucket.try_acquire():
+                stats.throttled_requests += 1
                 return False
             
-            self.host_stats[host].total_requests += 1
+            limiter.stats.total_requests += 1
         
         return True
     
@@ -125,8 +239,10 @@ class AdaptiveRateLimiter:
             self._handle_success(host)
     
     def _handle_rate_limit_hit(self, host: Optional[str] = None):
-        self.stats.rate_limit_hits += 1
-        self.stats.last_429_time = time.time()
+        now = time.time()
+        stats = self.stats
+        stats.rate_limit_hits += 1
+        stats.last_429_time = now
         self._consecutive_successes = 0
         
         new_rate = max(
@@ -135,14 +251,16 @@ class AdaptiveRateLimiter:
         )
         self.current_rate = new_rate
         self.bucket.update_rate(new_rate)
-        self.stats.current_rate = new_rate
+        stats.current_rate = new_rate
         
-        if host and host in self.host_buckets:
-            self.host_stats[host].rate_limit_hits += 1
-            self.host_stats[host].last_429_time = time.time()
+        limiter = self.host_limiters.get(host) if host else None
+        if limiter is not None:
+            host_stats = limiter.stats
+            host_stats.rate_limit_hits += 1
+            host_stats.last_429_time = now
             host_rate = max(self.min_rate, new_rate / 2)
-            self.host_buckets[host].update_rate(host_rate)
-            self.host_stats[host].current_rate = host_rate
+            limiter.bucket.update_rate(host_rate)
+            host_stats.current_rate = host_rate
     
     def _handle_success(self, host: Optional[str] = None):
         self._consecutive_successes += 1
@@ -159,21 +277,22 @@ class AdaptiveRateLimiter:
             self.stats.current_rate = new_rate
     
     def get_stats(self) -> Dict:
+        stats = self.stats
         return {
             "global": {
-                "total_requests": self.stats.total_requests,
-                "throttled_requests": self.stats.throttled_requests,
-                "rate_limit_hits": self.stats.rate_limit_hits,
-                "current_rate": self.stats.current_rate,
-                "last_429_time": self.stats.last_429_time
+                "total_requests": stats.total_requests,
+                "throttled_requests": stats.throttled_requests,
+                "rate_limit_hits": stats.rate_limit_hits,
+                "current_rate": stats.current_rate,
+                "last_429_time": stats.last_429_time
             },
             "per_host": {
                 host: {
-                    "total_requests": stats.total_requests,
-                    "rate_limit_hits": stats.rate_limit_hits,
-                    "current_rate": stats.current_rate
+                    "total_requests": limiter.stats.total_requests,
+                    "rate_limit_hits": limiter.stats.rate_limit_hits,
+                    "current_rate": limiter.stats.current_rate
                 }
-                for host, stats in self.host_stats.items()
+                for host, limiter in self.host_limiters.items()
             }
         }
     
@@ -181,8 +300,7 @@ class AdaptiveRateLimiter:
         self.current_rate = DEFAULT_RATE_LIMIT
         self.bucket = TokenBucket(self.current_rate, DEFAULT_BURST_SIZE)
         self.stats = RateLimitStats(current_rate=self.current_rate)
-        self.host_buckets.clear()
-        self.host_stats.clear()
+        self.host_limiters.clear()
         self._consecutive_successes = 0
 
 
@@ -7,14 +7,15 @@ import re
 
 import signal
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Set
+from itertools import islice
+from typing import List, Dict, Optional, Tuple, Set, Iterable
 from rich.progress import Progress, TextColumn, BarColumn, TimeRemainingColumn
 from rich.console import Console
 from urllib.parse import urlparse
-from aiohttp import ClientSession, TCPConnector, ClientTimeout
-import socket
+from aiohttp import ClientSession, ClientTimeout
 
 from scripts.logger import get_logger
+from scripts.config import get_shared_connector
 
 adv_logger = get_logger('logs')
 console = Console()
@@ -122,16 +123,7 @@ class Scanner:
         
     async def create_session(self):
         try:
-            connector = TCPConnector(
-                ssl=False,  
-                limit=self.config.MAX_CONCURRENT_TASKS,
-                ttl_dns_cache=300,  
-                force_close=False,  
-                enable_cleanup_closed=True,
-                family=socket.AF_INET,  
-                keepalive_timeout=30.0,  
-                limit_per_host=8  
-            )
+            connector = get_shared_connector(self.config.MAX_CONCURRENT_TASKS)
             
             timeout = ClientTimeout(
                 total=self.config.CONNECTION_TIMEOUT,
@@ -142,6 +134,7 @@ class Scanner:
             
             self.session = ClientSession(
                 connector=connector,
+                connector_owner=False,
                 timeout=timeout,
                 trust_env=True,
                 auto_decompress=True,  
@@ -736,11 +729,16 @@ class Scanner:
         
         return False
 
-    async def scan(self, url: str, paths: List[str], concurrency: int = 0) -> List[Dict]:
-        if not paths:
+    async def scan(self, url: str, paths: Iterable[str], concurrency: int = 0, total: Optional[int] = None) -> List[Dict]:
+        if total is None and hasattr(paths, '__len__'):
+            total = len(paths)
+        
+        if total == 0:
             adv_logger.log_warning(f"No paths to scan for {url}")
             return []
         
+        path_iter = iter(paths)
+        
         self._clear_success_file()
         
         self.running = True
@@ -758,7 +756,7 @@ class Scanner:
             "url": url,
             "mode": self.config.DETECTION_MODE,
             "start_time": time.time(),
-            "paths_count": len(paths),
+            "paths_count": total,
             "concurrency": concurrency if concurrency > 0 else self.config.MAX_CONCURRENT_TASKS,
             "mode_details": mode_config
         }
@@ -778,7 +776,7 @@ class Scanner:
         self.has_catch_all = await self._detect_catch_all(url)
         
         workers = concurrency or self.config.MAX_CONCURRENT_TASKS
-        batch_size = self.config.BATCH_SIZE or min(50, len(paths))
+        batch_size = self.config.BATCH_SIZE or 50
         
         try:
             progress = Progress(
@@ -790,7 +788,7 @@ class Scanner:
                 console=console
             )
             
-            console.print(f"[cyan]Starting scan of [bold]{url}[/bold] with [bold]{len(paths)}[/bold] paths[/cyan]")
+            console.print(f"[cyan]Starting scan of [bold]{url}[/bold] with [bold]{total if total is not None else 'streamed'}[/bold] paths[/cyan]")
             console.print(f"[cyan]Using [bold]{workers}[/bold] concurrent workers and batch size of [bold]{batch_size}[/bold][/cyan]")
             console.print(f"[cyan]Mode: [bold]{self.config.DETECTION_MODE}[/bold] - {mode_config.get('DESCRIPTION', '')}[/cyan]")
             
@@ -798,11 +796,10 @@ class Scanner:
             found_count = 0
             verified_count = 0
             rejected_count = 0
-            
-            batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+            scanned_count = 0
             
             with progress:
-                task_id = progress.add_task(f"Scanning {url}", total=len(paths))
+                task_id = progress.add_task(f"Scanning {url}", total=total)
                 
                 status_task_id = progress.add_task(
                     f"Found: [green]{found_count}[/green] Verified: [blue]{verified_count}[/blue] Rejected: [red]{rejected_count}[/red]", 
@@ -810,10 +807,15 @@ class Scanner:
                     completed=0
                 )
                 
-                for batch in batches:
+                while True:
                     if not self.running:  
                         console.print("[yellow]Scan stopped by user.[/yellow]")
                         break
+                    
+                    batch = list(islice(path_iter, batch_size))
+                    if not batch:
+                        break
+                    scanned_count += len(batch)
                         
                     if request_randomization:
                         random.shuffle(batch)
@@ -873,18 +875,22 @@ class Scanner:
                             await asyncio.sleep(actual_delay)
                         else:
                             await asyncio.sleep(delay_between_requests)
+                
+                if total != scanned_count:
+                    progress.update(task_id, total=scanned_count)
             
             self.scan_info["end_time"] = time.time()
+            self.scan_info["paths_count"] = scanned_count
             self.scan_info["duration"] = self.scan_info["end_time"] - self.scan_info["start_time"]
             self.scan_info["found_count"] = len(self.valid_results)
             self.scan_info["total_count"] = len(all_results)
-            self.scan_info["success_rate"] = len(self.valid_results) / len(paths) if paths else 0
+            self.scan_info["success_rate"] = len(self.valid_results) / scanned_count if scanned_count else 0
             self.scan_info["verified_count"] = verified_count
             self.scan_info["rejected_count"] = rejected_count
             
             adv_logger.log_scan_complete(
                 url, 
-                len(paths), 
+                scanned_count, 
                 len(self.valid_results), 
                 self.scan_info["duration"]
             )
@@ -2,6 +2,7 @@ import os
 import platform
 import re
 from datetime import datetime
+from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -61,11 +62,12 @@ class TerminalDisplay:
             title_align="center"
         ))
     
-    def show_target_info(self, url: str, scan_mode: str = "standard", wordlist_path: str = "", proxies_enabled: bool = False, headless_enabled: bool = False):
+    def show_target_info(self, url: str, scan_mode: str = "standard", wordlist_path: str = "", proxies_enabled: bool = False, headless_enabled: bool = False, paths_count: Optional[int] = None):
         panel = Panel(
             f"[bold white]Target:[/bold white] [cyan]{url}[/cyan]\n"
             f"[bold white]Mode:[/bold white] [cyan]{scan_mode}[/cyan]" + 
-            (f"\n[bold white]Wordlist:[/bold white] [cyan]{os.path.basename(wordlist_path)}[/cyan]" if wordlist_path else ""),
+            (f"\n[bold white]Wordlist:[/bold white] [cyan]{os.path.basename(wordlist_path)}[/cyan]" if wordlist_path else "") +
+            (f"\n[bold white]Paths:[/bold white] [cyan]{paths_count}[/cyan]" if paths_count is not None else ""),
             title="[bold]Scan Configuration[/bold]",
             border_style="cyan",
             box=box.ROUNDED
@@ -1,6 +1,7 @@
 import os
 import re
 import sys
+import json
 import signal
 import asyncio
 import urllib.parse
@@ -14,8 +15,25 @@ import platform
 
 from scripts.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 adv_logger = get_logger('logs')
 
+def json_loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(data: Any, pretty: bool = False) -> bytes:
+    if pretty:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 def validate_url(url: str) -> Tuple[bool, str]:
     if not url.startswith(('http://', 'https://')):
         url = 'http://' + url
@@ -0,0 +1,72 @@
+import re
+from functools import partial
+from typing import Iterator, List, Optional, Tuple
+
+from scripts.logger import get_logger
+from scripts.constants import MAX_PATH_LENGTH
+from scripts.input_validator import iter_valid_paths
+from scripts.utils import json_loads
+
+adv_logger = get_logger('logs')
+
+READ_BUFFER_SIZE = 1 << 20
+
+FORBIDDEN_PATH_BYTES = re.compile(rb'\.\.|%0[0ad]', re.IGNORECASE)
+
+
+def _iter_split_lines(f) -> Iterator[bytes]:
+    tail = b''
+    for chunk in iter(partial(f.read, READ_BUFFER_SIZE), b''):
+        lines = (tail + chunk).splitlines() if tail else chunk.splitlines()
+        tail = b'' if chunk.endswith((b'\n', b'\r')) else lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def _iter_raw_lines(wordlist_path: str) -> Iterator[bytes]:
+    strip = bytes.strip
+    is_forbidden = FORBIDDEN_PATH_BYTES.search
+    with open(wordlist_path, 'rb', buffering=0) as f:
+        for raw in _iter_split_lines(f):
+            raw = strip(raw)
+            if not raw or raw.startswith(b'#') or is_forbidden(raw):
+                continue
+            if len(raw) > MAX_PATH_LENGTH and raw.isascii():
+                continue
+            yield raw
+
+
+def _iter_text_lines(wordlist_path: str) -> Iterator[str]:
+    for raw in _iter_raw_lines(wordlist_path):
+        yield raw.decode('utf-8', 'ignore')
+
+
+def _read_json_entries(wordlist_path: str) -> List:
+    with open(wordlist_path, 'rb') as f:
+        data = json_loads(f.read())
+
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and 'paths' in data:
+        return data['paths']
+
+    adv_logger.log_error(f"Invalid JSON format in wordlist: {wordlist_path}")
+    return []
+
+
+def _is_path_entry(entry) -> bool:
+    return bool(entry) and isinstance(entry, str)
+
+
+def _iter_paths(wordlist_path: str, json_entries: Optional[List]) -> Iterator[str]:
+    if json_entries is None:
+        return iter_valid_paths(_iter_text_lines(wordlist_path))
+    return iter_valid_paths(filter(_is_path_entry, json_entries))
+
+
+def load_wordlist(wordlist_path: str) -> Tuple[Iterator[str], int]:
+    json_entries = _read_json_entries(wordlist_path) if wordlist_path.endswith('.json') else None
+
+    total = sum(1 for _ in _iter_paths(wordlist_path, json_entries))
+    return _iter_paths(wordlist_path, json_entries), total
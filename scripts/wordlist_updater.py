@@ -1,14 +1,46 @@
 import os
 import json
 import shutil
-import requests
+import aiohttp
+from typing import List, Optional
+from aiohttp import TCPConnector
 
 from scripts.logger import get_logger
+from scripts.utils import json_loads, json_dumps
 
 adv_logger = get_logger('logs')
 
+DOWNLOAD_CHUNK_SIZE = 1 << 16
 
-def auto_update_wordlist(wordlist_path, update_source=None):
+_ADMIN_PATTERNS = (
+    "admin", "administrator", "admincp", "admins", "admin/login", "admin/dashboard",
+    "login", "wp-admin", "wp-login.php", "panel", "cpanel", "control", "dashboard",
+    "adm", "moderator", "webadmin", "adminarea", "bb-admin", "adminLogin", "admin_area",
+    "backend", "cmsadmin", "administration", "cms", "manage", "portal", "supervisor",
+    "manager", "mgr", "user/admin", "user/login", "siteadmin", "console", "admin1",
+    "adminpanel", "robots.txt", "sitemap.xml", ".env", ".git/config", ".htaccess",
+    "server-status", "phpmyadmin", "myadmin", "pma", "system", "admincontrol"
+)
+
+_VARIANT_SUFFIXES = ("", "/", ".php", ".html", ".asp", ".aspx", ".jsp")
+
+_DEFAULT_VARIANTS = frozenset(
+    f"{pattern}{suffix}" for pattern in _ADMIN_PATTERNS for suffix in _VARIANT_SUFFIXES
+)
+
+
+def _split_lines(text: str) -> List[str]:
+    return list(filter(None, map(str.strip, text.split('\n'))))
+
+
+def _discard_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def auto_update_wordlist(wordlist_path, update_source=None, connector: Optional[TCPConnector] = None):
     try:
         adv_logger.log_info(f"Attempting to auto-update wordlist: {wordlist_path}")
 
@@ -33,29 +65,50 @@ def auto_update_wordlist(wordlist_path, update_source=None):
         original_count = len(existing_paths)
         adv_logger.log_info(f"Current wordlist has {original_count} entries")
 
+        combined = set(existing_paths)
+        del existing_paths
         new_paths = []
         if update_source and update_source.startswith(('http://', 'https://')):
             try:
                 headers = {
                     'User-Agent': 'FindTheAdminPanel/7.0 WordlistUpdater'
                 }
-                response = requests.get(update_source, timeout=10, headers=headers, verify=False)
-
-                if response.status_code == 200:
-                    content_type = response.headers.get('Content-Type', '')
-
-                    if 'json' in content_type:
-                        fetched_data = response.json()
-                        if isinstance(fetched_data, list):
-                            new_paths = fetched_data
-                        elif isinstance(fetched_data, dict) and 'paths' in fetched_data:
-                            new_paths = fetched_data.get('paths', [])
-                    else:
-                        new_paths = [line.strip() for line in response.text.split('\n') if line.strip()]
-
-                    adv_logger.log_info(f"Fetched {len(new_paths)} paths from {update_source}")
-                else:
-                    adv_logger.log_warning(f"Failed to fetch paths from {update_source}, status code: {response.status_code}")
+                fetched_count = 0
+                async with aiohttp.ClientSession(
+                    connector=connector,
+                    connector_owner=connector is None,
+                    headers=headers,
+                    auto_decompress=True
+                ) as session:
+                    async with session.get(
+                        update_source,
+                        timeout=aiohttp.ClientTimeout(total=10),
+                        ssl=False
+                    ) as response:
+                        if response.status == 200:
+                            if 'json' in response.headers.get('Content-Type', ''):
+                                fetched_data = json_loads(await response.read())
+                                if isinstance(fetched_data, list):
+                                    new_paths = fetched_data
+                                elif isinstance(fetched_data, dict) and 'paths' in fetched_data:
+                                    new_paths = fetched_data.get('paths', [])
+                                fetched_count = len(new_paths)
+                            else:
+                                encoding = response.charset or 'utf-8'
+                                tail = b''
+                                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                    block, _, tail = (tail + chunk).rpartition(b'\n')
+                                    if block:
+                                        lines = _split_lines(block.decode(encoding, 'replace'))
+                                        combined.update(lines)
+                                        fetched_count += len(lines)
+                                lines = _split_lines(tail.decode(encoding, 'replace'))
+                                combined.update(lines)
+                                fetched_count += len(lines)
+
+                            adv_logger.log_info(f"Fetched {fetched_count} paths from {update_source}")
+                        else:
+                            adv_logger.log_warning(f"Failed to fetch paths from {update_source}, status code: {response.status}")
             except Exception as e:
                 adv_logger.log_error(f"Error fetching paths from {update_source}: {str(e)}")
 
@@ -71,51 +124,47 @@ def auto_update_wordlist(wordlist_path, update_source=None):
                                 new_paths = fetched_data.get('paths', [])
                         except json.JSONDecodeError:
                             f.seek(0)
-                            new_paths = [line.strip() for line in f if line.strip()]
+                            new_paths = _split_lines(f.read())
                     else:
-                        new_paths = [line.strip() for line in f if line.strip()]
+                        new_paths = _split_lines(f.read())
 
                 adv_logger.log_info(f"Read {len(new_paths)} paths from file {update_source}")
             except Exception as e:
                 adv_logger.log_error(f"Error reading paths from file {update_source}: {str(e)}")
 
         else:
-            admin_patterns = [
-                "admin", "administrator", "admincp", "admins", "admin/login", "admin/dashboard",
-                "login", "wp-admin", "wp-login.php", "panel", "cpanel", "control", "dashboard",
-                "adm", "moderator", "webadmin", "adminarea", "bb-admin", "adminLogin", "admin_area",
-                "backend", "cmsadmin", "administration", "cms", "manage", "portal", "supervisor",
-                "manager", "mgr", "user/admin", "user/login", "siteadmin", "console", "admin1",
-                "adminpanel", "robots.txt", "sitemap.xml", ".env", ".git/config", ".htaccess",
-                "server-status", "phpmyadmin", "myadmin", "pma", "system", "admincontrol"
-            ]
-
-            variants = []
-            for pattern in admin_patterns:
-                variants.append(pattern)
-                variants.append(f"{pattern}/")
-                variants.append(f"{pattern}.php")
-                variants.append(f"{pattern}.html")
-                variants.append(f"{pattern}.asp")
-                variants.append(f"{pattern}.aspx")
-                variants.append(f"{pattern}.jsp")
-
-            new_paths = list(set(variants))
+            new_paths = _DEFAULT_VARIANTS
             adv_logger.log_info(f"Generated {len(new_paths)} admin path patterns for enrichment")
 
-        combined_paths = list(set(existing_paths + new_paths))
-
-        combined_paths.sort()
+        combined.update(new_paths)
+        del new_paths
+        combined_paths = sorted(combined)
+        del combined
 
+        tmp_path = f"{wordlist_path}.tmp"
         backup_path = f"{wordlist_path}.bak"
+        backup_tmp_path = f"{backup_path}.tmp"
         try:
-            shutil.copy2(wordlist_path, backup_path)
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(combined_paths))
+
+            try:
+                _discard_file(backup_tmp_path)
+                try:
+                    os.link(wordlist_path, backup_tmp_path)
+                except OSError:
+                    shutil.copy2(wordlist_path, backup_tmp_path)
+                os.replace(backup_tmp_path, backup_path)
+            except Exception as e:
+                error_msg = f"Failed to create backup, wordlist left unchanged: {str(e)}"
+                adv_logger.log_error(error_msg)
+                return False, error_msg, {}
             adv_logger.log_info(f"Created backup at {backup_path}")
-        except Exception as e:
-            adv_logger.log_warning(f"Failed to create backup: {str(e)}")
 
-        with open(wordlist_path, 'w') as f:
-            json.dump(combined_paths, f, indent=2)
+            os.replace(tmp_path, wordlist_path)
+        finally:
+            _discard_file(tmp_path)
+            _discard_file(backup_tmp_path)
 
         final_count = len(combined_paths)
         added_count = final_count - original_count